@@ -20,12 +20,16 @@ from xml.etree.ElementTree import ElementTree
 from xml.etree.ElementTree import SubElement
 
 import fsspec
+import imagecodecs
+import numpy as np
 from PIL import Image
 from PIL import ImageFile
 from tifffile import TiffFile
 from tifffile import TiffPage
 from tifffile import TIFF
 
+from tiffslide.tiffslide import _LANCZOS
+
 # improve robustness when encountering corrupted tiles
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
@@ -201,7 +205,8 @@ class MinimalComputeAperioDZGenerator:
             # SLOW PATH:
             # -> the frontend requests a dzi layer that's not available in the svs
             # we need to compute new tiles from lower levels
-            dst = Image.new("RGB", (2 * self._tile_size, 2 * self._tile_size))
+            # note: composite the decoded tiles in numpy and create a single PIL.Image
+            dst = np.zeros((2 * self._tile_size, 2 * self._tile_size, 3), dtype=np.uint8)
 
             out_width = out_height = 0
             for ix, iy in [(0, 0), (0, 1), (1, 0), (1, 1)]:
@@ -215,29 +220,31 @@ class MinimalComputeAperioDZGenerator:
                 except IndexError:
                     continue
 
-                with BytesIO(data) as buffer:
-                    im = Image.open(buffer)
-                    if ix == 0:
-                        out_height += im.height
-                    if iy == 0:
-                        out_width += im.width
-                    dst.paste(im, (ix * self._tile_size, iy * self._tile_size))
+                arr = imagecodecs.jpeg_decode(data)
+                im_height, im_width = arr.shape[:2]
+                if ix == 0:
+                    out_height += im_height
+                if iy == 0:
+                    out_width += im_width
+                dx, dy = ix * self._tile_size, iy * self._tile_size
+                dst[dy:dy + im_height, dx:dx + im_width] = arr.reshape(im_height, im_width, -1)
 
             if out_width == 0 or out_height == 0:
                 raise IndexError(
                     f"tile index ({x}, {y}) at INTERMEDIATE level={level} out of bounds"
                 )
 
-            elif (out_width, out_height) != dst.size:
-                dst = dst.crop((0, 0, out_width, out_height))
+            elif (out_width, out_height) != dst.shape[1::-1]:
+                dst = dst[:out_height, :out_width]
                 thumb_size = (max(1, out_width // 2), max(1, out_height // 2))
 
             else:
                 thumb_size = (self._tile_size, self._tile_size)
 
-            dst.thumbnail(thumb_size, Image.ANTIALIAS)
+            im = Image.frombytes("RGB", (out_width, out_height), dst.tobytes())
+            im.thumbnail(thumb_size, _LANCZOS)
             with BytesIO() as buffer:
-                dst.save(buffer, format="JPEG")
+                im.save(buffer, format="JPEG")
                 return buffer.getvalue()
 
         else:
@@ -1,12 +1,21 @@
+import io
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 import fsspec
+import numpy as np
 import pytest
 import importlib
+import tifffile
+
+from PIL import Image
 
 import tiffslide
 from tiffslide import TiffSlide
 from tiffslide import TiffFileError
+from tiffslide.tiffslide import _decode_jpeg_page
 
 
 @pytest.fixture
@@ -30,6 +39,13 @@ def test_image_open_unsupported_image(tmp_path):
         TiffSlide(f)
 
 
+def test_image_open_unsupported_shape(tmp_path):
+    f = tmp_path.joinpath("grayscale.tif")
+    tifffile.imwrite(f, np.zeros((64, 64), dtype=np.uint8))
+    with pytest.raises(TiffFileError):
+        TiffSlide(f)
+
+
 def test_image_open(svs_small):
     TiffSlide(svs_small)
 
@@ -64,6 +80,35 @@ def test_image_properties(slide, svs_small_props):
     assert slide.properties == svs_small_props
 
 
+def _check_slide_properties(t):
+    assert t.properties["tiffslide.vendor"] == "aperio"
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires the fork start method"
+)
+def test_image_properties_fork_during_warmup(svs_small, monkeypatch):
+    import time
+    import tiffslide.tiffslide as ts_module
+
+    def slow_svs_description_metadata(description):
+        time.sleep(0.5)
+        return svs_description_metadata(description)
+
+    svs_description_metadata = ts_module.svs_description_metadata
+    monkeypatch.setattr(ts_module, "svs_description_metadata", slow_svs_description_metadata)
+
+    with TiffSlide(svs_small) as t:
+        # fork while the warmup thread parses the properties
+        p = multiprocessing.get_context("fork").Process(target=_check_slide_properties, args=(t,))
+        p.start()
+        p.join(timeout=30)
+        if p.is_alive():
+            p.kill()
+            pytest.fail("properties access deadlocked in the forked child")
+    assert p.exitcode == 0
+
+
 def test_image_get_best_level_for_downsample(slide):
     # single layer image...
     assert slide.get_best_level_for_downsample(1.0) == 0
@@ -79,6 +124,125 @@ def test_image_read_region_as_array(slide):
     assert slide.read_region((0, 0), 0, (2220, 2967), as_array=True).shape[:2] == (2967, 2220)
 
 
+@pytest.mark.parametrize(
+    "location,size",
+    [
+        ((0, 0), (2220, 2967)),
+        ((123, 456), (500, 300)),
+        ((2100, 2900), (300, 300)),
+    ],
+)
+def test_image_read_region_matches_zarr(slide, location, size):
+    (x, y), (w, h) = location, size
+    arr = slide.read_region(location, 0, size, as_array=True)
+    np.testing.assert_array_equal(arr, slide.ts_zarr_grp[y:y + h, x:x + w])
+    # read again from the tile cache
+    np.testing.assert_array_equal(arr, slide.read_region(location, 0, size, as_array=True))
+
+
+def test_image_read_region_uses_filehandle_lock(slide):
+    # tile reads share the file handle with the zarr store, so they have to use the same lock
+    with ThreadPoolExecutor(1) as pool:
+        with slide.ts_tifffile.filehandle.lock:
+            future = pool.submit(slide.read_region, (0, 0), 0, (240, 240))
+            with pytest.raises(FuturesTimeoutError):
+                future.result(timeout=0.2)
+        assert future.result().size == (240, 240)
+
+
+def test_image_read_region_does_not_wait_for_lazy_init(slide):
+    # the lock guarding lazily initialized state (held by the warmup) is not needed for tile reads
+    with ThreadPoolExecutor(1) as pool:
+        with slide._lock:
+            future = pool.submit(slide.read_region, (0, 0), 0, (240, 240))
+            assert future.result(timeout=10).size == (240, 240)
+
+
+def test_image_read_region_after_closing_other_slide(svs_small):
+    # the tile decoding pool is shared by all slides and must outlive them
+    with TiffSlide(svs_small) as t:
+        expected = t.read_region((123, 456), 0, (500, 300), as_array=True)
+    with TiffSlide(svs_small) as t:
+        np.testing.assert_array_equal(t.read_region((123, 456), 0, (500, 300), as_array=True), expected)
+
+
+def _read_region_shape(path):
+    with TiffSlide(path) as t:
+        return t.read_region((300, 300), 0, (700, 700), as_array=True).shape
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires the fork start method"
+)
+def test_image_read_region_after_fork(svs_small, slide):
+    # start the shared decode pool before forking (e.g. torch DataLoader workers)
+    slide.read_region((0, 0), 0, (1000, 1000))
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        shape = pool.apply_async(_read_region_shape, (svs_small,)).get(timeout=30)
+    assert shape == (700, 700, 3)
+
+
+def test_image_read_region_compressed_jpeg(slide):
+    data = slide.read_region((240, 480), 0, (240, 240), return_compressed_jpeg=True)
+    img = Image.open(io.BytesIO(data))
+    assert img.format == "JPEG"
+    assert img.size == (240, 240)
+    arr = slide.read_region((240, 480), 0, (240, 240), as_array=True)
+    np.testing.assert_array_equal(np.asarray(img), arr)
+
+
+def test_image_read_region_compressed_jpeg_unaligned(slide):
+    with pytest.raises(ValueError):
+        slide.read_region((1, 0), 0, (240, 240), return_compressed_jpeg=True)
+
+
+def test_image_read_region_aligned_tile_is_writable(slide):
+    arr = slide.read_region((240, 240), 0, (240, 240), as_array=True)
+    arr[:] = 0
+    # writing to the returned array must not modify the cached tile
+    assert slide.read_region((240, 240), 0, (240, 240), as_array=True).any()
+
+
+def test_image_read_region_tile_cache_disabled(svs_small, slide):
+    with TiffSlide(svs_small, tile_cache_size=0) as t:
+        arr = t.read_region((123, 456), 0, (500, 300), as_array=True)
+        assert t._tile_cache.cache_info().currsize == 0
+    np.testing.assert_array_equal(arr, slide.read_region((123, 456), 0, (500, 300), as_array=True))
+
+
+def test_image_tile_cache_size_negative(svs_small):
+    with pytest.raises(ValueError):
+        TiffSlide(svs_small, tile_cache_size=-1)
+
+
+def test_image_read_region_n_handles(svs_small, slide):
+    with TiffSlide(svs_small, n_handles=4) as t:
+        arr = t.read_region((123, 456), 0, (500, 300), as_array=True)
+    np.testing.assert_array_equal(arr, slide.read_region((123, 456), 0, (500, 300), as_array=True))
+
+
+def test_image_read_region_n_handles_concurrent(svs_small, slide):
+    locations = [(x, y) for x in range(0, 2220, 300) for y in range(0, 2967, 300)]
+    expected = [slide.read_region(loc, 0, (500, 300), as_array=True) for loc in locations]
+    with TiffSlide(svs_small, n_handles=2, tile_cache_size=0) as t:
+        with ThreadPoolExecutor(8) as pool:
+            results = pool.map(lambda loc: t.read_region(loc, 0, (500, 300), as_array=True), locations)
+            for arr, exp in zip(results, expected):
+                np.testing.assert_array_equal(arr, exp)
+
+
+@pytest.mark.parametrize("n_handles", [0, -1])
+def test_image_n_handles_invalid(svs_small, n_handles):
+    with pytest.raises(ValueError):
+        TiffSlide(svs_small, n_handles=n_handles)
+
+
+def test_image_n_handles_requires_path(svs_small):
+    with open(svs_small, "rb") as f:
+        with pytest.raises(ValueError):
+            TiffSlide(f, n_handles=4)
+
+
 @pytest.mark.parametrize("use_embedded", [True, False])
 def test_image_get_thumbnail(slide, use_embedded):
     thumb = slide.get_thumbnail((200, 200), use_embedded=use_embedded)
@@ -97,6 +261,43 @@ def test_image_associated_images(slide):
         assert img.size
 
 
+def test_image_associated_images_contains_does_not_decode(slide):
+    assoc = slide.associated_images
+    assert "label" in assoc
+    assert "not-an-associated-image" not in assoc
+    assert not assoc._m
+
+
+def test_decode_jpeg_page_matches_tifffile(tmp_path):
+    pytest.importorskip("simplejpeg")
+    y, x = np.mgrid[0:100, 0:130]
+    data = np.stack([x * 3 % 256, y * 5 % 256, (x + y) * 2 % 256], axis=-1).astype(np.uint8)
+    f = tmp_path.joinpath("associated.tif")
+    tifffile.imwrite(f, data, compression="jpeg", photometric="rgb")
+    with tifffile.TiffFile(f) as t:
+        series = t.series[0]
+        arr = _decode_jpeg_page(series.pages[0])
+        assert arr is not None
+        np.testing.assert_array_equal(arr, series.asarray())
+
+
+def test_image_associated_images_cache_size(svs_small):
+    with TiffSlide(svs_small, associated_images_cache_size=1) as t:
+        assoc = t.associated_images
+        for key in assoc:
+            assert assoc[key].size
+        assert len(assoc._m) == 1
+
+
+def test_image_associated_images_cache_size_concurrent(svs_small):
+    with TiffSlide(svs_small, associated_images_cache_size=1) as t:
+        assoc = t.associated_images
+        keys = list(assoc) * 20
+        with ThreadPoolExecutor(4) as pool:
+            for img in pool.map(assoc.__getitem__, keys):
+                assert img.size
+
+
 def test_tiffslide_from_fsspec(svs_small_urlpath):
     with fsspec.open(svs_small_urlpath) as f:
         slide = TiffSlide(f)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import math
+import os
+import queue
 import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from functools import lru_cache
 from types import TracebackType
 from typing import Any
+from typing import BinaryIO
 from typing import Dict
 from typing import Iterator
 from typing import Mapping
@@ -26,18 +33,24 @@ else:
     from importlib_metadata import version
     from typing_extensions import Literal
 
+import numpy as np
 import tifffile
 import zarr
 from PIL import Image
 from tifffile import TiffFile
 from tifffile import TiffFileError as TiffFileError
+from tifffile import TiffPage
 from tifffile import TiffPageSeries
 from tifffile.tifffile import svs_description_metadata
 
 from tiffslide._types import PathOrFileLike
 
+try:
+    import simplejpeg
+except ImportError:  # pragma: no cover
+    simplejpeg = None
+
 if TYPE_CHECKING:
-    import numpy as np
     import numpy.typing as npt
 
 
@@ -61,6 +74,19 @@ __all__ = [
 _TIFFFILE_VERSION = tuple(
     int(x) if x.isdigit() else x for x in version("tifffile").split(".")
 )
+# tifffile 2021.6.14 fixed the svs parsing.
+_TIFFFILE_FIXED_SVS_PARSING = _TIFFFILE_VERSION >= (2021, 6, 14)
+# used to emulate the fixed svs description parsing on older tifffile versions
+_APERIO_DESC_STRIP_RE = re.compile(r";Aperio [^;|]*(?=[|])")
+
+# Image.ANTIALIAS was removed in pillow 10
+try:
+    _LANCZOS = Image.Resampling.LANCZOS
+except AttributeError:  # pragma: no cover
+    _LANCZOS = getattr(Image, "LANCZOS")  # pillow < 9.1
+
+# default number of decoded tiles kept in memory per slide
+_TILE_CACHE_SIZE = 64
 
 # === Constants to support drop-in ===
 PROPERTY_NAME_COMMENT = "tiffslide.comment"
@@ -79,13 +105,95 @@ PROPERTY_NAME_BOUNDS_HEIGHT = "tiffslide.bounds-height"
 class TiffSlide:
     """
     tifffile backed whole slide image container emulating openslide.OpenSlide
+
+    Parameters
+    ----------
+    filename :
+        path or file-like object of the slide
+    tile_cache_size :
+        number of decoded tiles kept in memory for overlapping reads (0 disables caching).
+        each cached tile uses tile_width * tile_height * samples bytes, i.e. ~170kB
+        for 240x240 rgb tiles and ~3MB for 1024x1024 rgb tiles.
+    associated_images_cache_size :
+        maximum number of decoded associated images kept in memory.
+        if None (default), decoded associated images are kept until the slide is closed.
+    n_handles :
+        number of additional file handles to read tiles from concurrently.
+        if None (default), all tiles are read through the TiffFile's handle.
+        requires `filename` to be a path.
     """
 
-    def __init__(self, filename: PathOrFileLike):
+    def __init__(
+        self,
+        filename: PathOrFileLike,
+        *,
+        tile_cache_size: int = _TILE_CACHE_SIZE,
+        associated_images_cache_size: Optional[int] = None,
+        n_handles: Optional[int] = None,
+    ):
+        if tile_cache_size < 0:
+            raise ValueError(f"tile_cache_size must be >= 0, got {tile_cache_size!r}")
+        if associated_images_cache_size is not None and associated_images_cache_size < 0:
+            raise ValueError(
+                f"associated_images_cache_size must be >= 0, got {associated_images_cache_size!r}"
+            )
+        path: Optional[Union[str, bytes]] = None
+        if n_handles is not None:
+            if not isinstance(filename, (str, bytes, os.PathLike)):
+                raise ValueError("n_handles requires filename to be a path")
+            if n_handles < 1:
+                raise ValueError(f"n_handles must be >= 1, got {n_handles!r}")
+            path = os.fspath(filename)
+
         self.ts_tifffile: TiffFile = TiffFile(filename)  # may raise TiffFileError
+        # all reads from the shared file handle (tiles, zarr, tifffile) synchronize via its lock
+        self.ts_tifffile.filehandle.lock = True
+
+        # cache the baseline series and its levels, they don't change after opening
+        self._series0: TiffPageSeries = self.ts_tifffile.series[0]
+        if self._series0.ndim != 3:
+            self.ts_tifffile.close()
+            # loosen restrictions in future versions
+            raise TiffFileError(
+                f"unsupported image with shape {self._series0.shape!r}, expected (height, width, samples)"
+            )
+        self._levels: Tuple[TiffPageSeries, ...] = tuple(self._series0.levels)
+        self._level_dims: Tuple[Tuple[int, int], ...] = tuple(
+            lvl.shape[1::-1] for lvl in self._levels
+        )
+        self._base_wh: Tuple[int, int] = self._level_dims[0]
+        self._level_pages: Tuple[TiffPage, ...] = tuple(lvl.pages[0] for lvl in self._levels)
+        # (tile_height, tile_width) per level, (0, 0) if tiles can't be read directly
+        self._level_tile_shapes: Tuple[Tuple[int, int], ...] = tuple(
+            _get_tile_shape(lvl) for lvl in self._levels
+        )
+        # guards the lazily initialized attributes
+        self._lock = threading.RLock()
+        # overlapping reads usually hit the same tiles, so keep the decoded ones around
+        self._tile_cache = lru_cache(maxsize=tile_cache_size)(self._read_tile)
+        self._associated_images_cache_size = associated_images_cache_size
+
         self._zarr_grp: Optional[Union[zarr.core.Array, zarr.hierarchy.Group]] = None
+        self._zarr_arrays: Tuple[zarr.core.Array, ...] = ()
         self._metadata: Optional[Dict[str, Any]] = None
 
+        # separate handles allow reading tiles from multiple threads without locking
+        self._handle_pool: Optional[queue.Queue[BinaryIO]] = None
+        if n_handles is not None and path is not None:
+            self._handle_pool = queue.Queue()
+            try:
+                for _ in range(n_handles):
+                    self._handle_pool.put(open(path, "rb"))
+            except Exception:
+                while not self._handle_pool.empty():
+                    self._handle_pool.get_nowait().close()
+                self.ts_tifffile.close()
+                raise
+
+        # prepare the lazily initialized state while the caller does other work
+        self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+        self._warmup_thread.start()
+
     def __enter__(self) -> TiffSlide:
         return self
 
@@ -98,12 +206,19 @@ class TiffSlide:
         self.close()
 
     def close(self) -> None:
+        self._warmup_thread.join()
         if self._zarr_grp:
             try:
                 self._zarr_grp.close()
             except AttributeError:
                 pass  # Arrays dont need to be closed
             self._zarr_grp = None
+            self._zarr_arrays = ()
+        self._tile_cache.cache_clear()
+        if self._handle_pool is not None:
+            while not self._handle_pool.empty():
+                self._handle_pool.get_nowait().close()
+            self._handle_pool = None
         self.ts_tifffile.close()
 
     def __repr__(self) -> str:
@@ -125,133 +240,136 @@ class TiffSlide:
     @property
     def dimensions(self) -> Tuple[int, int]:
         """return the width and height of level 0"""
-        series0 = self.ts_tifffile.series[0]
-        assert series0.ndim == 3, "loosen restrictions in future versions"
-        h, w, _ = series0.shape
-        return w, h
+        return self._base_wh
 
     @property
     def level_count(self) -> int:
         """return the number of levels"""
-        return len(self.ts_tifffile.series[0].levels)
+        return len(self._levels)
 
     @property
     def level_dimensions(self) -> Tuple[Tuple[int, int], ...]:
         """return the dimensions of levels as a list"""
-        return tuple(lvl.shape[1::-1] for lvl in self.ts_tifffile.series[0].levels)
+        return self._level_dims
 
-    @property
+    @cached_property
     def level_downsamples(self) -> Tuple[float, ...]:
         """return the downsampling factors of levels as a list"""
-        w0, h0 = self.dimensions
-        return tuple(math.sqrt((w0 * h0) / (w * h)) for w, h in self.level_dimensions)
+        w0, h0 = self._base_wh
+        return tuple(math.sqrt((w0 * h0) / (w * h)) for w, h in self._level_dims)
 
     @cached_property
     def properties(self) -> Dict[str, Any]:
         """image properties / metadata as a dict"""
         if self._metadata is None:
-            aperio_desc = self.ts_tifffile.pages[0].description
+            self._metadata = self._parse_properties()
+        return self._metadata
 
-            if _TIFFFILE_VERSION >= (2021, 6, 14):
-                # tifffile 2021.6.14 fixed the svs parsing.
-                _aperio_desc = aperio_desc
-                _aperio_recovered_header = None  # no need to recover
+    def _parse_properties(self) -> Dict[str, Any]:
+        """parse the image properties from the tiff tags and the svs description"""
+        aperio_desc = self.ts_tifffile.pages[0].description
 
-            else:
-                # this emulates the new description parsing for older versions
-                _aperio_desc = re.sub(r";Aperio [^;|]*(?=[|])", "", aperio_desc, 1)
-                _aperio_recovered_header = aperio_desc.split("|", 1)[0]
+        if _TIFFFILE_FIXED_SVS_PARSING:
+            _aperio_desc = aperio_desc
+            _aperio_recovered_header = None  # no need to recover
 
+        else:
+            # this emulates the new description parsing for older versions
+            _aperio_desc = _APERIO_DESC_STRIP_RE.sub("", aperio_desc, count=1)
+            _aperio_recovered_header = aperio_desc.split("|", 1)[0]
+
+        try:
+            aperio_meta = svs_description_metadata(_aperio_desc)
+        except ValueError as err:
+            if "invalid Aperio image description" in str(err):
+                warn(f"{err} - {self!r}")
+                aperio_meta = {}
+            else:
+                raise
+            vendor = "generic-tiff"  # todo: need to handle more supported formats in the future
+        else:
+            # Normalize the aperio metadata
+            aperio_meta.pop("", None)
+            aperio_meta.pop("Aperio Image Library", None)
+            if aperio_meta and "Header" not in aperio_meta:
+                aperio_meta["Header"] = _aperio_recovered_header
+            vendor = "aperio"
+
+        md = {
+            PROPERTY_NAME_COMMENT: aperio_desc,
+            PROPERTY_NAME_VENDOR: vendor,
+            PROPERTY_NAME_QUICKHASH1: None,
+            PROPERTY_NAME_BACKGROUND_COLOR: None,
+            PROPERTY_NAME_OBJECTIVE_POWER: aperio_meta.get("AppMag", None),
+            PROPERTY_NAME_MPP_X: aperio_meta.get("MPP", None),
+            PROPERTY_NAME_MPP_Y: aperio_meta.get("MPP", None),
+            PROPERTY_NAME_BOUNDS_X: None,
+            PROPERTY_NAME_BOUNDS_Y: None,
+            PROPERTY_NAME_BOUNDS_WIDTH: None,
+            PROPERTY_NAME_BOUNDS_HEIGHT: None,
+        }
+        for k, v in sorted(aperio_meta.items()):
+            md[f"aperio.{k}"] = v
+
+        _ds_dimensions_pages = zip(self.level_downsamples, self._level_dims, self._level_pages)
+        for lvl, (ds, (width, height), page) in enumerate(_ds_dimensions_pages):
+            md[f"tiffslide.level[{lvl}].downsample"] = ds
+            md[f"tiffslide.level[{lvl}].height"] = height
+            md[f"tiffslide.level[{lvl}].width"] = width
+            md[f"tiffslide.level[{lvl}].tile-height"] = page.tilelength
+            md[f"tiffslide.level[{lvl}].tile-width"] = page.tilewidth
+
+        md["tiff.ImageDescription"] = aperio_desc
+
+        if md[PROPERTY_NAME_MPP_X] is None or md[PROPERTY_NAME_MPP_Y] is None:
+            # recover mpp from tiff tags
             try:
-                aperio_meta = svs_description_metadata(_aperio_desc)
-            except ValueError as err:
-                if "invalid Aperio image description" in str(err):
-                    warn(f"{err} - {self!r}")
-                    aperio_meta = {}
-                else:
-                    raise
-                vendor = "generic-tiff"  # todo: need to handle more supported formats in the future
+                resolution_unit = self.ts_tifffile.pages[0].tags["ResolutionUnit"].value
+                x_resolution = Fraction(*self.ts_tifffile.pages[0].tags["XResolution"].value)
+                y_resolution = Fraction(*self.ts_tifffile.pages[0].tags["YResolution"].value)
+            except KeyError:
+                pass
             else:
-                # Normalize the aperio metadata
-                aperio_meta.pop("", None)
-                aperio_meta.pop("Aperio Image Library", None)
-                if aperio_meta and "Header" not in aperio_meta:
-                    aperio_meta["Header"] = _aperio_recovered_header
-                vendor = "aperio"
-
-            md = {
-                PROPERTY_NAME_COMMENT: aperio_desc,
-                PROPERTY_NAME_VENDOR: vendor,
-                PROPERTY_NAME_QUICKHASH1: None,
-                PROPERTY_NAME_BACKGROUND_COLOR: None,
-                PROPERTY_NAME_OBJECTIVE_POWER: aperio_meta.get("AppMag", None),
-                PROPERTY_NAME_MPP_X: aperio_meta.get("MPP", None),
-                PROPERTY_NAME_MPP_Y: aperio_meta.get("MPP", None),
-                PROPERTY_NAME_BOUNDS_X: None,
-                PROPERTY_NAME_BOUNDS_Y: None,
-                PROPERTY_NAME_BOUNDS_WIDTH: None,
-                PROPERTY_NAME_BOUNDS_HEIGHT: None,
-            }
-            md.update({f"aperio.{k}": v for k, v in sorted(aperio_meta.items())})
-
-            _ds_dimensions = zip(self.level_downsamples, self.level_dimensions)
-            for lvl, (ds, (width, height)) in enumerate(_ds_dimensions):
-                page = self.ts_tifffile.series[0].levels[lvl].pages[0]
-                md[f"tiffslide.level[{lvl}].downsample"] = ds
-                md[f"tiffslide.level[{lvl}].height"] = height
-                md[f"tiffslide.level[{lvl}].width"] = width
-                md[f"tiffslide.level[{lvl}].tile-height"] = page.tilelength
-                md[f"tiffslide.level[{lvl}].tile-width"] = page.tilewidth
-
-            md["tiff.ImageDescription"] = aperio_desc
-
-            if md[PROPERTY_NAME_MPP_X] is None or md[PROPERTY_NAME_MPP_Y] is None:
-                # recover mpp from tiff tags
-                try:
-                    resolution_unit = self.ts_tifffile.pages[0].tags["ResolutionUnit"].value
-                    x_resolution = Fraction(*self.ts_tifffile.pages[0].tags["XResolution"].value)
-                    y_resolution = Fraction(*self.ts_tifffile.pages[0].tags["YResolution"].value)
-                except KeyError:
-                    pass
-                else:
-                    md['tiff.ResolutionUnit'] = resolution_unit.name
-                    md['tiff.XResolution'] = float(x_resolution)
-                    md['tiff.YResolution'] = float(y_resolution)
-
-                    RESUNIT = tifffile.TIFF.RESUNIT
-                    scale = {
-                        RESUNIT.INCH: 25400.0,
-                        RESUNIT.CENTIMETER: 10000.0,
-                        RESUNIT.MILLIMETER: 1000.0,
-                        RESUNIT.MICROMETER: 1.0,
-                        RESUNIT.NONE: None,
-                    }.get(resolution_unit, None)
-                    if scale is not None:
-                        try:
-                            mpp_x = scale / x_resolution
-                            mpp_y = scale / y_resolution
-                        except ArithmeticError:
-                            pass
-                        else:
-                            md[PROPERTY_NAME_MPP_X] = mpp_x
-                            md[PROPERTY_NAME_MPP_Y] = mpp_y
-
-            self._metadata = md
-        return self._metadata
+                md['tiff.ResolutionUnit'] = resolution_unit.name
+                md['tiff.XResolution'] = float(x_resolution)
+                md['tiff.YResolution'] = float(y_resolution)
+
+                RESUNIT = tifffile.TIFF.RESUNIT
+                scale = {
+                    RESUNIT.INCH: 25400.0,
+                    RESUNIT.CENTIMETER: 10000.0,
+                    RESUNIT.MILLIMETER: 1000.0,
+                    RESUNIT.MICROMETER: 1.0,
+                    RESUNIT.NONE: None,
+                }.get(resolution_unit, None)
+                if scale is not None:
+                    try:
+                        mpp_x = scale / x_resolution
+                        mpp_y = scale / y_resolution
+                    except ArithmeticError:
+                        pass
+                    else:
+                        md[PROPERTY_NAME_MPP_X] = mpp_x
+                        md[PROPERTY_NAME_MPP_Y] = mpp_y
+
+        return md
 
     @cached_property
     def associated_images(self) -> _LazyAssociatedImagesDict:
         """return associated images as a mapping of names to PIL images"""
-        return _LazyAssociatedImagesDict(self.ts_tifffile)
+        return _LazyAssociatedImagesDict(self.ts_tifffile, maxsize=self._associated_images_cache_size)
 
     def get_best_level_for_downsample(self, downsample: float) -> int:
         """return the best level for a given downsampling factor"""
         if downsample <= 1.0:
             return 0
-        for lvl, ds in enumerate(self.level_downsamples):
-            if ds >= downsample:
-                return lvl - 1
-        return self.level_count - 1
+        # index of the first level with a downsample >= the requested one
+        idx = int(np.searchsorted(self._level_downsamples_arr, downsample, side="left"))
+        return min(idx, self.level_count) - 1
+
+    @cached_property
+    def _level_downsamples_arr(self) -> npt.NDArray[np.float64]:
+        return np.asarray(self.level_downsamples, dtype=np.float64)
 
     @property
     def ts_zarr_grp(self) -> Union[zarr.core.Array, zarr.hierarchy.Group]:
@@ -259,10 +377,152 @@ class TiffSlide:
 
         NOTE: this is extra functionality and not part of the drop-in behaviour
         """
-        if self._zarr_grp is None:
-            store = self.ts_tifffile.series[0].aszarr()
-            self._zarr_grp = zarr.open(store, mode="r")
-        return self._zarr_grp
+        with self._lock:
+            if self._zarr_grp is None:
+                store = self._series0.aszarr()
+                grp = zarr.open(store, mode="r")
+                # resolve the per level arrays once, so read_region can index directly
+                if isinstance(grp, zarr.core.Array):
+                    self._zarr_arrays = (grp,)
+                else:
+                    self._zarr_arrays = tuple(grp[str(lvl)] for lvl in range(len(self._levels)))
+                self._zarr_grp = grp
+            return self._zarr_grp
+
+    def _read_level_region(
+        self, location: Tuple[int, int], level: int, size: Tuple[int, int]
+    ) -> npt.NDArray[np.int_]:
+        """read the requested region from the level's pixel data
+
+        Parameters
+        ----------
+        location :
+            pixel location (x, y) in level 0 of the image
+        level :
+            target level used to read the image
+        size :
+            size (width, height) of the requested region
+        """
+        rx0, ry0, rx1, ry1 = self._get_level_bounds(location, level, size)
+
+        tile_h, tile_w = self._level_tile_shapes[level]
+        if not (tile_h and tile_w) or rx0 < 0 or ry0 < 0:
+            if not self._zarr_arrays:
+                _ = self.ts_zarr_grp  # materialize the zarr arrays
+            arr: npt.NDArray[np.int_] = self._zarr_arrays[level][ry0:ry1, rx0:rx1]
+            return arr
+
+        level_w, level_h = self._level_dims[level]
+        rx1 = min(rx1, level_w)
+        ry1 = min(ry1, level_h)
+        if _is_tile_aligned(rx0, ry0, rx1, ry1, tile_h, tile_w):
+            # pass through the (read-only) cached tile, no need to stitch
+            return self._tile_cache(level, rx0 // tile_w, ry0 // tile_h)
+
+        # stitch the region from the (cached) tiles overlapping it
+        lvl = self._levels[level]
+        out: npt.NDArray[np.int_] = np.empty(
+            (max(ry1 - ry0, 0), max(rx1 - rx0, 0), *lvl.shape[2:]), dtype=lvl.dtype
+        )
+        tile_indices = [
+            (tx, ty)
+            for ty in range(ry0 // tile_h, (ry1 + tile_h - 1) // tile_h)
+            for tx in range(rx0 // tile_w, (rx1 + tile_w - 1) // tile_w)
+        ]
+
+        def paste_tile(index: Tuple[int, int]) -> None:
+            # tiles cover disjoint parts of out, so they can be pasted concurrently
+            tx, ty = index
+            tile = self._tile_cache(level, tx, ty)
+            tx0, ty0 = tx * tile_w, ty * tile_h
+            x0, x1 = max(rx0, tx0), min(rx1, tx0 + tile_w)
+            y0, y1 = max(ry0, ty0), min(ry1, ty0 + tile_h)
+            out[y0 - ry0:y1 - ry0, x0 - rx0:x1 - rx0] = tile[y0 - ty0:y1 - ty0, x0 - tx0:x1 - tx0]
+
+        if len(tile_indices) > 1:
+            # decoding and copying release the gil, so both run in parallel
+            for _ in _get_decode_pool().map(paste_tile, tile_indices):
+                pass  # propagate exceptions
+        else:
+            for index in tile_indices:
+                paste_tile(index)
+        return out
+
+    def _get_level_bounds(
+        self, location: Tuple[int, int], level: int, size: Tuple[int, int]
+    ) -> Tuple[int, int, int, int]:
+        """return the (x0, y0, x1, y1) bounds of a region in level coordinates"""
+        base_x, base_y = location
+        base_w, base_h = self._base_wh
+        level_w, level_h = self._level_dims[level]
+        rx0 = (base_x * level_w) // base_w
+        ry0 = (base_y * level_h) // base_h
+        _rw, _rh = size
+        return rx0, ry0, rx0 + _rw, ry0 + _rh
+
+    def _read_tile_data(self, level: int, tx: int, ty: int) -> Tuple[int, Optional[bytes]]:
+        """return the segment index and encoded bytes of a tile (None if empty)"""
+        page = self._level_pages[level]
+        _, tile_w = self._level_tile_shapes[level]
+        index = ty * ((page.keyframe.imagewidth + tile_w - 1) // tile_w) + tx
+
+        # read the encoded tile directly from the file, skipping the zarr store
+        offset, bytecount = page.dataoffsets[index], page.databytecounts[index]
+        if not bytecount:
+            return index, None
+        if self._handle_pool is None:
+            fh = self.ts_tifffile.filehandle
+            with fh.lock:
+                fh.seek(offset)
+                return index, fh.read(bytecount)
+        f = self._handle_pool.get()
+        try:
+            f.seek(offset)
+            return index, f.read(bytecount)
+        finally:
+            self._handle_pool.put(f)
+
+    def _read_tile(self, level: int, tx: int, ty: int) -> npt.NDArray[np.int_]:
+        """return the decoded tile at tile index (tx, ty) of a level"""
+        page = self._level_pages[level]
+        keyframe = page.keyframe
+        index, data = self._read_tile_data(level, tx, ty)
+
+        decodeargs: Dict[str, Any] = {}
+        if keyframe.compression in _JPEG_COMPRESSIONS:
+            decodeargs["jpegtables"] = page.jpegtables
+            if getattr(keyframe, "jpegheader", None) is not None:
+                decodeargs["jpegheader"] = keyframe.jpegheader
+        segment, _, shape = keyframe.decode(data, index, **decodeargs)
+
+        # segments are returned as (depth, length, width, samples)
+        lvl = self._levels[level]
+        tile: npt.NDArray[np.int_]
+        if segment is None:
+            # empty tiles are filled with zeros, same as the zarr store
+            tile = np.zeros((shape[1], shape[2], *lvl.shape[2:]), dtype=lvl.dtype)
+        else:
+            tile = segment.reshape(segment.shape[1], segment.shape[2], *lvl.shape[2:])
+        # tiles are shared via the cache and may be passed through to the caller
+        tile.flags.writeable = False
+        return tile
+
+    def _warmup(self) -> None:
+        """initialize the tile decoders and svs properties"""
+        # note: this must not hold any lock that is required for reading tiles
+        for page in self._level_pages:
+            _ = page.keyframe.decode
+        if self.ts_tifffile.is_svs:
+            # generic tiffs warn when parsing the description, leave those to the caller
+            # note: don't access self.properties, forking while the warmup holds the
+            #   cached_property lock would deadlock the child on the properties access
+            try:
+                md = self._parse_properties()
+            except ValueError:
+                pass  # raised again when the caller accesses the properties
+            else:
+                if self._metadata is None:
+                    self._metadata = md
 
     def _read_region_as_array(
         self, location: Tuple[int, int], level: int, size: Tuple[int, int]
@@ -282,16 +542,19 @@ class TiffSlide:
         return self.read_region(location, level, size, as_array=True)
 
     @overload
-    def read_region(self, location: Tuple[int, int], level: int, size: Tuple[int, int], *, as_array: Literal[False] = ...) -> Image.Image: ...
+    def read_region(self, location: Tuple[int, int], level: int, size: Tuple[int, int], *, as_array: Literal[False] = ..., return_compressed_jpeg: Literal[False] = ...) -> Image.Image: ...
+    @overload
+    def read_region(self, location: Tuple[int, int], level: int, size: Tuple[int, int], *, as_array: Literal[True] = ..., return_compressed_jpeg: Literal[False] = ...) -> npt.NDArray[np.int_]: ...
     @overload
-    def read_region(self, location: Tuple[int, int], level: int, size: Tuple[int, int], *, as_array: Literal[True] = ...) -> npt.NDArray[np.int_]: ...
+    def read_region(self, location: Tuple[int, int], level: int, size: Tuple[int, int], *, as_array: Literal[False] = ..., return_compressed_jpeg: Literal[True]) -> bytes: ...
 
     def read_region(
         self,
         location: Tuple[int, int], level: int, size: Tuple[int, int],
         *,
-        as_array: bool = False
-    ) -> Union[Image.Image, npt.NDArray[np.int_]]:
+        as_array: bool = False,
+        return_compressed_jpeg: bool = False
+    ) -> Union[Image.Image, npt.NDArray[np.int_], bytes]:
         """return the requested region as a PIL.Image
 
         Parameters
@@ -304,26 +567,49 @@ class TiffSlide:
             size (width, height) of the requested region
         as_array :
             if True, return the region as numpy array
+        return_compressed_jpeg :
+            if True, return the stored jpeg tile as bytes without decoding it.
+            the region has to match a tile in the level exactly.
         """
-        base_x, base_y = location
-        base_w, base_h = self.dimensions
-        level_w, level_h = self.level_dimensions[level]
-        rx0 = (base_x * level_w) // base_w
-        ry0 = (base_y * level_h) // base_h
-        _rw, _rh = size
-        rx1 = rx0 + _rw
-        ry1 = ry0 + _rh
-        arr: npt.NDArray[np.int_]
-        if isinstance(self.ts_zarr_grp, zarr.core.Array):
-            arr = self.ts_zarr_grp[ry0:ry1, rx0:rx1]
-        else:
-            arr = self.ts_zarr_grp[str(level)][ry0:ry1, rx0:rx1]
+        if return_compressed_jpeg:
+            if as_array:
+                raise ValueError("as_array and return_compressed_jpeg are mutually exclusive")
+            return self._read_compressed_jpeg(location, level, size)
 
+        arr = self._read_level_region(location, level, size)
         if as_array:
-            return arr
+            # tiles passed through from the cache are read-only
+            return arr if arr.flags.writeable else arr.copy()
+        elif arr.dtype == np.uint8 and arr.ndim == 3 and arr.shape[2] == 3:
+            # rgb is the common case: skip the mode inference of Image.fromarray
+            h, w, _ = arr.shape
+            return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(arr), "raw", "RGB", 0, 1)
         else:
             return Image.fromarray(arr)
 
+    def _read_compressed_jpeg(
+        self, location: Tuple[int, int], level: int, size: Tuple[int, int]
+    ) -> bytes:
+        """return the jpeg tile matching the requested region as bytes"""
+        rx0, ry0, rx1, ry1 = self._get_level_bounds(location, level, size)
+        level_w, level_h = self._level_dims[level]
+        tile_h, tile_w = self._level_tile_shapes[level]
+        page = self._level_pages[level]
+        if not (tile_h and tile_w) or not _is_rgb_jpeg(page.keyframe):
+            raise ValueError(f"level {level} is not stored as rgb jpeg tiles")
+        if not (
+            0 <= rx0 and 0 <= ry0 and rx1 <= level_w and ry1 <= level_h
+            and _is_tile_aligned(rx0, ry0, rx1, ry1, tile_h, tile_w)
+        ):
+            raise ValueError(
+                f"region {(rx0, ry0, rx1 - rx0, ry1 - ry0)} does not match a "
+                f"({tile_w}, {tile_h}) tile in level {level}"
+            )
+        _, data = self._read_tile_data(level, rx0 // tile_w, ry0 // tile_h)
+        if data is None:
+            raise ValueError(f"region {(rx0, ry0, tile_w, tile_h)} in level {level} is empty")
+        return _build_jpeg(page, data)
+
     def get_thumbnail(self, size: Tuple[int, int], *, use_embedded: bool = False) -> Image.Image:
         """return the thumbnail of the slide as a PIL.Image with a maximum size
 
@@ -351,34 +637,51 @@ class TiffSlide:
         downsample = max(slide_w / thumb_w, slide_h / thumb_h)
         level = self.get_best_level_for_downsample(downsample)
 
-        level_byte_size = self.ts_tifffile.series[0].levels[level].size
+        level_byte_size = self._levels[level].size
 
+        arr: Optional[npt.NDArray[Any]]
         if 0 < thumb_byte_size < level_byte_size:
             # read the embedded thumbnail if it uses fewer bytes
-            img = self.associated_images['thumbnail']
+            arr = np.asarray(self.associated_images['thumbnail'])
         else:
             # read the best suited level
-            _level_dimensions = self.level_dimensions[level]
-            img = self.read_region((0, 0), level, _level_dimensions)
-
-        # now composite the thumbnail
-        thumb = Image.new(
-            mode="RGB",
-            size=img.size,
-            color=f"#{self.properties[PROPERTY_NAME_BACKGROUND_COLOR] or 'ffffff'}",
-        )
-        thumb.paste(img, box=None, mask=None)
-        thumb.thumbnail(size, Image.ANTIALIAS)
+            arr = _decode_jpeg_page(self._level_pages[level])
+            if arr is None:
+                _level_dimensions = self._level_dims[level]
+                arr = self.read_region((0, 0), level, _level_dimensions, as_array=True)
+
+        # now composite the thumbnail: transparent pixels show the background color
+        if arr.ndim == 3 and arr.shape[2] == 4:
+            background = bytes.fromhex(self.properties[PROPERTY_NAME_BACKGROUND_COLOR] or "ffffff")
+            rgb = arr[..., :3].copy()
+            rgb[arr[..., 3] == 0] = np.frombuffer(background, dtype=np.uint8)
+            arr = rgb
+
+        thumb = Image.fromarray(arr)
+        if thumb.mode != "RGB":
+            thumb = thumb.convert("RGB")
+        thumb.thumbnail(size, _LANCZOS)
         return thumb
 
 
 class _LazyAssociatedImagesDict(Mapping[str, Image.Image]):
-    """lazily load associated images"""
+    """lazily load associated images
+
+    Parameters
+    ----------
+    tifffile :
+        the tifffile providing the associated images as series
+    maxsize :
+        the maximum number of decoded images kept in memory (unbounded if None)
+    """
 
-    def __init__(self, tifffile: TiffFile):
+    def __init__(self, tifffile: TiffFile, maxsize: Optional[int] = None):
         series = tifffile.series[1:]
         self.series_map: Dict[str, TiffPageSeries] = {s.name.lower(): s for s in series}
-        self._m: Dict[str, Image.Image] = {}
+        self._m: OrderedDict[str, Image.Image] = OrderedDict()
+        self._maxsize = maxsize
+        # guards the lru bookkeeping of _m, images are decoded without holding it
+        self._lock = threading.Lock()
 
     def __repr__(self) -> str:
         args = ", ".join(
@@ -389,15 +692,129 @@ class _LazyAssociatedImagesDict(Mapping[str, Image.Image]):
         return f"{{{args}}}"
 
     def __getitem__(self, k: str) -> Image.Image:
-        if k in self._m:
-            return self._m[k]
-        else:
-            s = self.series_map[k]
-            self._m[k] = img = Image.fromarray(s.asarray())
-            return img
+        with self._lock:
+            if k in self._m:
+                self._m.move_to_end(k)
+                return self._m[k]
+
+        s = self.series_map[k]
+        arr = _decode_jpeg_page(s.pages[0]) if len(s.pages) == 1 else None
+        if arr is None:
+            # tifffile reads contiguous uncompressed series without the file handle lock
+            with s.parent.filehandle.lock:
+                arr = s.asarray()
+        img = Image.fromarray(arr)
+
+        with self._lock:
+            self._m[k] = img
+            if self._maxsize is not None and len(self._m) > self._maxsize:
+                self._m.popitem(last=False)  # evict the least recently used
+        return img
+
+    def __contains__(self, k: object) -> bool:
+        # Mapping.__contains__ would decode the image via __getitem__
+        return k in self.series_map
 
     def __len__(self) -> int:
         return len(self.series_map)
 
     def __iter__(self) -> Iterator[str]:
         yield from self.series_map
+
+
+# thread pool for decoding tiles, shared by all slides and created on first use
+_DECODE_POOL: Optional[ThreadPoolExecutor] = None
+_DECODE_POOL_LOCK = threading.Lock()
+
+
+def _get_decode_pool() -> ThreadPoolExecutor:
+    """return the shared tile decoding thread pool"""
+    global _DECODE_POOL
+    with _DECODE_POOL_LOCK:
+        if _DECODE_POOL is None:
+            _DECODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return _DECODE_POOL
+
+
+def _reset_decode_pool() -> None:
+    """drop the decode pool in forked children, its worker threads don't exist there"""
+    global _DECODE_POOL, _DECODE_POOL_LOCK
+    _DECODE_POOL = None
+    _DECODE_POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on windows
+    os.register_at_fork(after_in_child=_reset_decode_pool)
+
+
+# compression schemes that need the JPEGTables tag for decoding (same as tifffile)
+_JPEG_COMPRESSIONS = frozenset({6, 7, 33007, 34892})
+
+
+def _get_tile_shape(series: TiffPageSeries) -> Tuple[int, int]:
+    """return the (height, width) of a level's tiles or (0, 0) if not tiled
+
+    Only levels stored in a single tiled page with contiguous samples are
+    supported for reading tiles directly.
+    """
+    page = series.keyframe
+    if (
+        len(series.pages) != 1
+        or not page.is_tiled
+        or page.tiledepth > 1
+        or page.planarconfig != tifffile.TIFF.PLANARCONFIG.CONTIG
+    ):
+        return 0, 0
+    return page.tilelength, page.tilewidth
+
+
+# Adobe APP14 marker signaling that the jpeg color channels are not transformed
+_JPEG_ADOBE_RGB_MARKER = b"\xFF\xEE\x00\x0E\x41\x64\x6F\x62\x65\x00\x64\x80\x00\x00\x00\x00"
+
+
+def _is_tile_aligned(x0: int, y0: int, x1: int, y1: int, tile_h: int, tile_w: int) -> bool:
+    """return if the region covers exactly one tile of the tile grid"""
+    return x0 % tile_w == 0 and y0 % tile_h == 0 and x1 - x0 == tile_w and y1 - y0 == tile_h
+
+
+def _is_rgb_jpeg(page: TiffPage) -> bool:
+    """return if the page is stored as baseline 8bit rgb jpeg"""
+    return bool(
+        page.compression == tifffile.TIFF.COMPRESSION.JPEG
+        and page.planarconfig == tifffile.TIFF.PLANARCONFIG.CONTIG
+        and page.photometric in {tifffile.TIFF.PHOTOMETRIC.RGB, tifffile.TIFF.PHOTOMETRIC.YCBCR}
+        and page.bitspersample == 8
+        and page.samplesperpixel == 3
+    )
+
+
+def _build_jpeg(page: TiffPage, data: bytes) -> bytes:
+    """build a self-contained jpeg from an abbreviated jpeg segment of the page"""
+    header = b"\xFF\xD8" if page.jpegtables is None else page.jpegtables[:-2]
+    if page.photometric == tifffile.TIFF.PHOTOMETRIC.RGB:
+        header += _JPEG_ADOBE_RGB_MARKER
+    return header + data[2:]
+
+
+def _decode_jpeg_page(page: TiffPage) -> Optional[npt.NDArray[np.uint8]]:
+    """decode a page stored as a single jpeg segment via simplejpeg
+
+    Returns None if simplejpeg is not installed or the page can't be
+    decoded this way, in which case the caller should fall back to tifffile.
+    """
+    if (
+        simplejpeg is None
+        or not _is_rgb_jpeg(page)
+        or len(page.dataoffsets) != 1
+        or not page.databytecounts[0]
+    ):
+        return None
+
+    fh = page.parent.filehandle
+    with fh.lock:
+        fh.seek(page.dataoffsets[0])
+        data = fh.read(page.databytecounts[0])
+
+    arr: npt.NDArray[np.uint8] = simplejpeg.decode_jpeg(_build_jpeg(page, data), colorspace="RGB")
+    # tiles and strips can be padded beyond the image boundary
+    return arr[: page.imagelength, : page.imagewidth]